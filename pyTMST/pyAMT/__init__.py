@@ -1 +1 @@
-from .pyAMT import auditory_filterbank, king2019_modfilterbank_updated
+from .pyAMT import design_auditory_filterbank, apply_auditory_filterbank, auditory_filterbank, king2019_modfilterbank_updated
@@ -22,6 +22,10 @@ this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 from  scipy.signal import butter, lfilter
 from gammatone.filters import make_erb_filters, erb_filterbank
@@ -29,7 +33,8 @@ from gammatone.filters import make_erb_filters, erb_filterbank
 from ..pyLTFAT import aud_space_bw
 
 
-def auditory_filterbank(sig, fs, fmin, fmax):
+@lru_cache(maxsize=8)
+def design_auditory_filterbank(fs, fmin, fmax):
     """
     Authors of the original MATLAB code: Peter L. Søndergaard
     """
@@ -37,12 +42,33 @@ def auditory_filterbank(sig, fs, fmin, fmax):
     bw = 1
     fc = aud_space_bw(fmin, fmax, bw)
     erb_coeff_arr = make_erb_filters(fs, fc)
-    gamma_responses = erb_filterbank(sig, erb_coeff_arr)
 
-    return gamma_responses, fc
+    # results are shared between calls through the cache
+    fc.flags.writeable = False
+    erb_coeff_arr.flags.writeable = False
+    return erb_coeff_arr, fc
 
 
-def king2019_modfilterbank_updated(sig, fs, mfmin, mfmax, modbank_Nmod, modbank_Qfactor):
+def apply_auditory_filterbank(sig, erb_coeff_arr):
+    """
+    Filters sig with the coefficients returned by design_auditory_filterbank
+    """
+
+    return erb_filterbank(sig, erb_coeff_arr)
+
+
+def auditory_filterbank(sig, fs, fmin, fmax):
+    """
+    Authors of the original MATLAB code: Peter L. Søndergaard
+    """
+
+    erb_coeff_arr, fc = design_auditory_filterbank(fs, fmin, fmax)
+    gamma_responses = apply_auditory_filterbank(sig, erb_coeff_arr)
+
+    return gamma_responses, fc.copy()
+
+
+def king2019_modfilterbank_updated(sig, fs, mfmin, mfmax, modbank_Nmod, modbank_Qfactor, max_workers=None):
     """
     Authors of the original MATLAB code:
     - Leo Varnet and Andrew King (2020)
@@ -57,17 +83,27 @@ def king2019_modfilterbank_updated(sig, fs, mfmin, mfmax, modbank_Nmod, modbank_
     flim = np.zeros((modbank_Nmod, 2))
     b = np.zeros((modbank_Nmod, 3))
     a = np.zeros((modbank_Nmod, 3))
-    outsig = np.zeros((sig.shape[0], sig.shape[1], modbank_Nmod))
+    # one contiguous (N, Nchan) slab per modulation filter, so each response is stored with a single block copy
+    outsig = np.empty((modbank_Nmod, sig.shape[0], sig.shape[1]), dtype=np.result_type(sig.dtype, np.float32))
 
     for ichan in range(modbank_Nmod):
         flim[ichan, :] = mfc[ichan] * np.sqrt(4 + 1 / modbank_Qfactor ** 2) / 2 + np.array([-1, 1]) * mfc[ichan] / modbank_Qfactor / 2
         b[ichan, :], a[ichan, :] = butter(1, 2 * flim[ichan, :] / fs, btype='band')
-        outsig[:, :, ichan] = lfilter(b[ichan, :], a[ichan, :], sig, axis=0)
+
+    # the filters are independent and lfilter releases the GIL, so run them on a thread pool;
+    # every running filter holds one (N, Nchan) temporary, so the pool size bounds extra memory
+    def apply_modfilter(ichan):
+        outsig[ichan] = lfilter(b[ichan, :], a[ichan, :], sig, axis=0)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(apply_modfilter, range(modbank_Nmod)))
 
     step = {
         'b': b,
         'a': a,
     }
 
-    return outsig.T, mfc, step
+    return outsig.transpose(0, 2, 1), mfc, step
 
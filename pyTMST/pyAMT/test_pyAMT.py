@@ -64,6 +64,17 @@ class TestPyAMT(unittest.TestCase):
                                    rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
 
 
+    def test_auditory_filterbank_returns_own_fc(self):
+        sig = np.random.rand(1000)
+        fs = 16000.
+
+        _, fc = pyAMT.auditory_filterbank(sig, fs, 70., 6700.)
+        fc *= 2
+        _, fc_again = pyAMT.auditory_filterbank(sig, fs, 70., 6700.)
+
+        np.testing.assert_array_equal(fc, 2 * fc_again)
+
+
     def test_king2019_modfilterbank_updated(self):
         sig = np.random.rand(30, 10000)
         fs = 2500.
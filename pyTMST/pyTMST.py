@@ -17,9 +17,8 @@ work. If not, see <https://creativecommons.org/licenses/by-nc/4.0/>.
 from collections import namedtuple
 
 import numpy as np
-from scipy.signal import hilbert
 
-from .utils import define_modulation_axis, segment_into_windows, periodogram, lombscargle, remove_artifacts, interpmean
+from .utils import define_modulation_axis, time_axis, segment_into_windows, hilbert_envelope, periodogram, lombscargle, remove_artifacts, interpmean
 from .pyLTFAT import aud_filt_bw
 from .pyAMT import auditory_filterbank, king2019_modfilterbank_updated
 from .yin import librosa_yin
@@ -31,44 +30,63 @@ AMi_spec_params = namedtuple('AMi_spec_params', ['t', 'f_bw', 'gamma_responses',
 f0M_spec_params = namedtuple('f0M_spec_params', ['t', 'f0', 'mf', 'mfb'])
 
 
-def AMa_spectrum(sig, fs, mfmin=0.5, mfmax=200, modbank_Nmod=200, fmin=70, fmax=6700):
+def _intermediates(return_intermediates, *arrays):
+    if return_intermediates == 'view':
+        views = tuple(arr.view() for arr in arrays)
+        for view in views:
+            view.flags.writeable = False
+        return views
+    if return_intermediates:
+        return arrays
+    return (None,) * len(arrays)
+
+
+def AMa_spectrum(sig, fs, mfmin=0.5, mfmax=200, modbank_Nmod=200, fmin=70, fmax=6700, dtype=np.float64, return_intermediates=False):
     if not isinstance(sig, np.ndarray) or not isinstance(fs, (int, float)):
         raise ValueError("Invalid input types.")
     if fs <= 0:
         raise ValueError("fs must be a positive scalar.")
+    if return_intermediates not in (False, True, 'view'):
+        raise ValueError("return_intermediates must be False, True or 'view'.")
+    if np.dtype(dtype) not in (np.float32, np.float64):
+        raise ValueError("dtype must be float32 or float64.")
     
-    t = np.arange(1,len(sig)+1) / fs
+    t = time_axis(len(sig), fs)
     gamma_responses, fc = auditory_filterbank(sig, fs, fmin, fmax)
-    E = np.abs(hilbert(gamma_responses, axis=1))
+    gamma_responses = gamma_responses.astype(dtype, copy=False)
+    E = hilbert_envelope(gamma_responses, axis=1)
     
     f_spectra, f_spectra_intervals = define_modulation_axis(mfmin, mfmax, modbank_Nmod)
-    Nchan = fc.shape[0]
-    AMspec = np.zeros((f_spectra.shape[0], Nchan))
-    for ichan in range(Nchan):
-        Pxx = periodogram(E[ichan, :], fs, f_spectra)
-        AMspec[:, ichan] = 2 * Pxx
+    AMspec = 2 * periodogram(E, fs, f_spectra).T
    
+    gamma_responses, E = _intermediates(return_intermediates, gamma_responses, E)
     step = AMa_spec_params(t, aud_filt_bw(fc), gamma_responses, E, f_spectra, f_spectra_intervals)
     return AMspec, fc, f_spectra, step
 
 
-def AMi_spectrum(sig, fs, mfmin=0.5, mfmax=200., modbank_Nmod=200, modbank_Qfactor=1, fmin=70, fmax=6700):
+def AMi_spectrum(sig, fs, mfmin=0.5, mfmax=200., modbank_Nmod=200, modbank_Qfactor=1, fmin=70, fmax=6700, dtype=np.float64, return_intermediates=False):
     if not isinstance(sig, np.ndarray) or not isinstance(fs, (int, float)):
         raise ValueError("Invalid input types.")
     if fs <= 0:
         raise ValueError("fs must be a positive scalar.")
+    if return_intermediates not in (False, True, 'view'):
+        raise ValueError("return_intermediates must be False, True or 'view'.")
+    if np.dtype(dtype) not in (np.float32, np.float64):
+        raise ValueError("dtype must be float32 or float64.")
     
-    t = np.arange(1,len(sig)+1) / fs
+    t = time_axis(len(sig), fs)
     gamma_responses, fc = auditory_filterbank(sig, fs, fmin, fmax)
-    E = np.abs(hilbert(gamma_responses, axis=1))
+    gamma_responses = gamma_responses.astype(dtype, copy=False)
+    E = hilbert_envelope(gamma_responses, axis=1)
 
     Nchan = fc.shape[0]
     AMfilt, mf, _ = king2019_modfilterbank_updated(E.T, fs, mfmin, mfmax, modbank_Nmod, modbank_Qfactor)
 
-    AMrms = np.sqrt(np.mean(AMfilt ** 2, axis=2)) * np.sqrt(2)
-    DC = np.mean(E.T, axis=0)
-    AMIspec = AMrms.T / (DC[:, np.newaxis] * np.ones(mf.shape[0]))
+    AMrms = np.sqrt(2 * np.einsum('ijk,ijk->ij', AMfilt, AMfilt, dtype=np.float64) / AMfilt.shape[2])
+    DC = E.mean(axis=1, dtype=np.float64)
+    AMIspec = AMrms.T / DC[:, np.newaxis]
 
+    gamma_responses, E = _intermediates(return_intermediates, gamma_responses, E)
     step = AMi_spec_params(t, aud_filt_bw(fc), gamma_responses, E, mf, AMrms, DC)
     return AMIspec, fc, mf, step
 
@@ -80,7 +98,7 @@ def f0M_spectrum(sig, fs, mfmin=.5, mfmax=200., modbank_Nmod=200, undersample=20
     f0 = remove_artifacts(f0, fs/undersample, max_jump, min_duration, (fmin, fmax), (.4, 2.5), 1500)
     f0_wo_nan = f0[~np.isnan(f0)]
 
-    t = np.arange(1, len(sig) + 1) / fs
+    t = time_axis(len(sig), fs)
     t_wo_nan = t[::undersample]
     t_wo_nan = t_wo_nan[:len(f0)]
     t_wo_nan = t_wo_nan[~np.isnan(f0)]
@@ -91,7 +109,7 @@ def f0M_spectrum(sig, fs, mfmin=.5, mfmax=200., modbank_Nmod=200, undersample=20
     f0Mfft *= 2
     f0M_spectrum = interpmean(f_spectra, f0Mfft, f_spectra_intervals)
 
-    t_f0 = np.arange(1, len(f0) + 1) / (fs / undersample)
+    t_f0 = time_axis(len(f0), fs / undersample)
     step = f0M_spec_params(t_f0, f0, f_spectra, f_spectra_intervals)
 
     return f0M_spectrum, f_spectra, step
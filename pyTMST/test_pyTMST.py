@@ -97,6 +97,53 @@ class TestPyTMST(unittest.TestCase):
                                    rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
 
 
+    def test_spectrum_dtype(self):
+        audio_path = './LaVoixHumaine_6s.wav'
+        sig, fs = sf.read(audio_path)
+        sig = sig[:fs, 0]
+
+        py_AMa_spec64, _, _, _ = pyTMST.AMa_spectrum(sig, fs)
+        py_AMa_spec32, _, _, py_step = pyTMST.AMa_spectrum(sig, fs, dtype=np.float32, return_intermediates=True)
+        self.assertEqual(py_step.gamma_responses.dtype, np.float32)
+        self.assertEqual(py_step.E.dtype, np.float32)
+        self.assertEqual(py_AMa_spec32.shape, py_AMa_spec64.shape)
+        np.testing.assert_allclose(py_AMa_spec64, py_AMa_spec32, rtol=1.e-3)
+
+        py_AMi_spec64, _, _, _ = pyTMST.AMi_spectrum(sig, fs)
+        py_AMi_spec32, _, _, py_step = pyTMST.AMi_spectrum(sig, fs, dtype=np.float32, return_intermediates=True)
+        self.assertEqual(py_step.E.dtype, np.float32)
+        self.assertEqual(py_AMi_spec32.shape, py_AMi_spec64.shape)
+        np.testing.assert_allclose(py_AMi_spec64, py_AMi_spec32, rtol=1.e-3)
+
+        for spectrum in (pyTMST.AMa_spectrum, pyTMST.AMi_spectrum):
+            for dtype in (np.int16, np.complex64):
+                with self.assertRaises(ValueError):
+                    spectrum(sig, fs, dtype=dtype)
+
+
+    def test_return_intermediates(self):
+        audio_path = './LaVoixHumaine_6s.wav'
+        sig, fs = sf.read(audio_path)
+        sig = sig[:fs, 0]
+
+        for spectrum in (pyTMST.AMa_spectrum, pyTMST.AMi_spectrum):
+            _, _, _, py_step = spectrum(sig, fs)
+            self.assertIsNone(py_step.gamma_responses)
+            self.assertIsNone(py_step.E)
+
+            _, _, _, py_step = spectrum(sig, fs, return_intermediates=True)
+            self.assertTrue(py_step.E.flags.writeable)
+            self.assertEqual(py_step.gamma_responses.shape, py_step.E.shape)
+
+            _, _, _, py_step = spectrum(sig, fs, return_intermediates='view')
+            self.assertFalse(py_step.gamma_responses.flags.writeable)
+            self.assertFalse(py_step.E.flags.writeable)
+            self.assertEqual(py_step.gamma_responses.shape, py_step.E.shape)
+
+            with self.assertRaises(ValueError):
+                spectrum(sig, fs, return_intermediates='views')
+
+
     def test_f0M_spectrum(self):
         audio_path = './LaVoixHumaine_6s.wav'
         mfmin, mfmax = .5, 200.
@@ -1,2 +1,2 @@
-from .utils import define_modulation_axis, gausswin, segment_into_windows, periodogram, lombscargle, interpmean, get_non_nan_segments, filter_max_jump, filter_by_duration, filter_by_variability, filter_by_absolute_range, filter_by_relative_range, remove_artifacts
+from .utils import define_modulation_axis, time_axis, gausswin, window_indices, segment_into_windows, hilbert_envelope, periodogram, lombscargle, interpmean, get_non_nan_segments, filter_max_jump, filter_by_duration, filter_by_variability, filter_by_absolute_range, filter_by_relative_range, remove_artifacts
 
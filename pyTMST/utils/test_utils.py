@@ -61,6 +61,12 @@ class TestUtils(unittest.TestCase):
                                    rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
 
 
+    def test_time_axis(self):
+        t = utils.time_axis(4, 2)
+        np.testing.assert_array_equal(t, [.5, 1., 1.5, 2.])
+        self.assertFalse(t.flags.writeable)
+
+
     def test_gausswin(self):
         n = 100
         alpha = 2.5
@@ -93,6 +99,16 @@ class TestUtils(unittest.TestCase):
                                    rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
 
 
+    def test_window_indices(self):
+        starts, width_in_sample = utils.window_indices(10, 1, 3, 2)
+        self.assertEqual(width_in_sample, 3)
+        np.testing.assert_array_equal(starts, [0, 2, 4, 6])
+        starts, _ = utils.window_indices(3, 1, 3, 0.5)
+        self.assertEqual(len(starts), 0)
+        with self.assertRaises(ValueError):
+            utils.window_indices(10, 1, 3, 0.5)
+
+
     def test_periodogram(self):
         fs = 1000
         t = np.arange(0, 1, 1/fs)
@@ -108,6 +124,21 @@ class TestUtils(unittest.TestCase):
                                    rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
 
 
+    def test_periodogram_multichannel(self):
+        fs = 1000
+        t = np.arange(0, 1, 1/fs)
+        sig = np.vstack([np.cos(2 * np.pi * 100 * t), np.sin(2 * np.pi * 200 * t), np.cos(2 * np.pi * 37.5 * t)])
+        freqs = [37.5, 100, 200]
+
+        py_pxx = utils.periodogram(sig, fs, freqs)
+
+        self.eng.eval(f"[pxx, f] = periodogram({matlab.double(sig.T.tolist())},[],{freqs},{fs},'psd');", nargout=0)
+        mat_pxx = np.squeeze(self.eng.workspace['pxx']).T
+
+        np.testing.assert_allclose(mat_pxx, py_pxx,
+                                   rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
+
+
     def test_lombscargle(self):
         def random_monotonic_range(a, b, size):
             rand_nums = np.random.rand(size)
@@ -240,6 +271,17 @@ class TestUtils(unittest.TestCase):
                                    rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
 
 
+    def test_hilbert_envelope(self):
+        t = np.arange(0, 1 + 1/1024, 1/1024)
+        x = np.vstack([np.sin(2 * np.pi * 60 * t), (1 + .5 * np.cos(2 * np.pi * 4 * t)) * np.sin(2 * np.pi * 200 * t)])
+        self.eng.workspace['x'] = matlab.double(x.T.tolist())
+        self.eng.eval("env = abs(hilbert(x));", nargout=0)
+        matlab_result = np.squeeze(self.eng.workspace['env']).T
+        python_result = utils.hilbert_envelope(x, axis=1)
+        np.testing.assert_allclose(matlab_result, python_result,
+                                   rtol=self.float_rel_tolerance, atol=self.float_abs_tolerance)
+
+
     def test_lp_butter_filter(self):
         audio_path = './LaVoixHumaine_6s.wav'
         order = 1
@@ -8,7 +8,10 @@ work. If not, see <https://creativecommons.org/licenses/by-nc/4.0/>.
 """
 
 
+from functools import lru_cache
+
 import numpy as np
+import scipy.fft
 import scipy.signal
 
 
@@ -19,17 +22,38 @@ def define_modulation_axis(mfmin, mfmax, nf):
     return f_spectra, f_spectra_intervals
 
 
+@lru_cache(maxsize=4)
+def time_axis(N, fs):
+    t = np.arange(1, N + 1) / fs
+    t.flags.writeable = False
+    return t
+
+
 def gausswin(N, alpha=2.5):
     n = np.arange(N)
     window = np.exp(-0.5 * ((alpha * (n - (N - 1) / 2)) / ((N - 1) / 2)) ** 2)
     return window
 
 
-def segment_into_windows(signal, fs, width, shift, gwin):
-    signal = np.array(signal).flatten()
+def window_indices(N, fs, width, shift):
     width_in_sample = int(np.floor(width * fs))
     shift_in_sample = int(np.floor(shift * fs))
 
+    # number of start indices i = k * shift with i + width < N
+    if N <= width_in_sample:
+        n_windows = 0
+    elif shift_in_sample == 0:
+        raise ValueError("shift must be at least one sample.")
+    else:
+        n_windows = -(-(N - width_in_sample) // shift_in_sample)
+    starts = np.arange(n_windows) * shift_in_sample
+    return starts, width_in_sample
+
+
+def segment_into_windows(signal, fs, width, shift, gwin):
+    signal = np.array(signal).flatten()
+    starts, width_in_sample = window_indices(len(signal), fs, width, shift)
+
     if gwin:
         G = gausswin(width_in_sample)
         norm = 1
@@ -37,64 +61,94 @@ def segment_into_windows(signal, fs, width, shift, gwin):
         G = np.ones(width_in_sample)
         norm = 1
 
-    windows = []
-    i = 0
-    while i + width_in_sample < len(signal):
-        windowed_signal = (signal[i:i+width_in_sample] * G) / norm
-        windows.append(windowed_signal)
-        i += shift_in_sample
+    windows = signal[starts[:, np.newaxis] + np.arange(width_in_sample)]
 
-    return np.array(windows)
+    return (windows * G) / norm
 
 
-def periodogram(sig, fs, freqs):
-    N = np.array(sig).shape[0]
+def hilbert_envelope(sig, axis=-1):
+    sig = np.asarray(sig)
+    N = sig.shape[axis]
+
+    # only the Hilbert transform H{x} is synthesised; |x + jH{x}| follows from x and H{x}
+    X_f = scipy.fft.rfft(sig, axis=axis, workers=-1)
+    shape = [1] * X_f.ndim
+    shape[axis] = X_f.shape[axis]
+    h = np.full(X_f.shape[axis], -1j)
+    h[0] = 0
+    if N % 2 == 0:
+        h[-1] = 0
+    X_f *= h.reshape(shape)
+    sig_h = scipy.fft.irfft(X_f, n=N, axis=axis, workers=-1)
+
+    return np.hypot(sig, sig_h)
+
+
+def _dft_basis(N, fs, freqs, dtype=np.complex128):
     T = 1.0 / fs
     dt = np.arange(0, N) * T
-    
-    dt = dt[:, np.newaxis]
-    freqs = np.array(freqs)[np.newaxis, :]
-    sig_expanded = sig[:, np.newaxis]
-    
-    X_f = np.sum(sig_expanded * np.exp(-1j * 2 * np.pi * freqs * dt), axis=0)
-    
+
+    if dtype == np.complex64:
+        # wrap the phase in float64 first so narrowing it stays accurate for long signals
+        phase = np.mod(2 * np.pi * np.array(freqs)[np.newaxis, :] * dt[:, np.newaxis], 2 * np.pi)
+        return np.exp(phase.astype(np.float32) * np.complex64(-1j))
+    return np.exp(-1j * 2 * np.pi * np.array(freqs)[np.newaxis, :] * dt[:, np.newaxis])
+
+
+def periodogram(sig, fs, freqs):
+    sig = np.asarray(sig)
+    N = sig.shape[-1]
+    freqs = np.ravel(freqs)
+
+    bins = freqs * N / fs
+    if np.all(np.abs(bins - np.round(bins)) < 1e-9) and np.all((bins >= 0) & (bins <= N // 2)):
+        # every frequency falls on the DFT grid, so a single rFFT gives all bins
+        X_f = scipy.fft.rfft(sig, axis=-1, workers=-1)[..., np.round(bins).astype(int)]
+    else:
+        # sig may hold one signal per row; all rows share the same basis,
+        # kept in complex64 for float32 input so sig is not widened to complex128
+        dtype = np.result_type(sig.dtype, np.complex64)
+        X_f = sig @ _dft_basis(N, fs, freqs, dtype)
+
     psd = (np.abs(X_f)**2) / (N * fs)
     return psd
 
 
 def lombscargle(t, sig, f):
     fs = t.shape[0] / (t[-1] - t[0])
-    t = t[~np.isnan(sig)]
-    sig = sig[~np.isnan(sig)]
+    is_not_nan = ~np.isnan(sig)
+    t = t[is_not_nan]
+    sig = sig[is_not_nan]
     pxx = (2 / fs) * scipy.signal.lombscargle(t, sig - np.mean(sig), 2*np.pi*f)
     return f, pxx
 
 
 def interpmean(x, y, xi):
+    order = np.argsort(x, kind='stable')
+    x = np.asarray(x)[order]
+    y = np.asarray(y)[order]
+    xi = np.asarray(xi)
+
+    # bounds of every closed interval [xi[i], xi[i+1]] in the sorted x, found once
+    idx_start = np.searchsorted(x, xi[:-1], side='left')
+    idx_end = np.searchsorted(x, xi[1:], side='right')
+
     Ni = len(xi)
     yi = np.empty(Ni - 1)
     yi.fill(np.nan)
 
     for i_sample in range(Ni - 1):
-        idx = (x >= xi[i_sample]) & (x <= xi[i_sample + 1])
-        yi[i_sample] = np.nanmean(y[idx])
+        yi[i_sample] = np.nanmean(y[idx_start[i_sample]:idx_end[i_sample]])
 
     return yi
 
 
 def get_non_nan_segments(arr):
-    is_not_nan = ~np.isnan(arr)
-    segments = []
-    i = 0
-    while i < len(is_not_nan):
-        if is_not_nan[i]:
-            start = i
-            while i < len(is_not_nan) and is_not_nan[i]:
-                i += 1
-            end = i
-            segments.append((start, end))
-        i += 1
-    return segments
+    is_not_nan = np.concatenate(([False], ~np.isnan(arr), [False]))
+    edges = np.diff(is_not_nan.astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return list(zip(starts.tolist(), ends.tolist()))
 
 
 def filter_max_jump(arr, maxjump):